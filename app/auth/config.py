@@ -4,6 +4,8 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     access_token_expire_day: int = Field(default=3)
+    access_token_cache_seconds: int = Field(default=300)
+    access_token_cache_size: int = Field(default=10000)
     secret_key: str
     algorithm: str
 
@@ -1,26 +1,39 @@
-from core.controllers import BaseControllers
+import asyncio
+
+from core.controllers import BaseControllers, register_converter
 from core.services import BaseServices
 from users.controllers import user_controllers
+from users.models import Users
 from core.dependencies import CommonsDependencies
 from . import schemas
 from .services import auth_services
 
+# Users rows are already validated, so login responses are built without a second validation pass
+register_converter(model=Users, schema=schemas.LoginResponse)
+
 class AuthControllers(BaseControllers):
+    __slots__ = ()
+
     def __init__(self, controller_name: str, service: BaseServices = None) -> None:
         super().__init__(controller_name, service)
 
     async def register_user(self, data: schemas.RegisterRequest, commons: CommonsDependencies) -> schemas.LoginResponse:
         user = await user_controllers.register(fullname=data.fullname, email=data.email, password=data.password, phone_number=data.phone_number, commons=commons)
-        extra_data = {}
-        extra_data["access_token"] = await self.service.create_access_token(user_id=user.id, user_type=user.type)
-        return self.convert_orm_to_schema(schema=schemas.LoginResponse, data=user, extra_data=extra_data)
+        access_token = await self.service.create_access_token(user_id=user.id, user_type=user.type)
+        return self.convert_orm_to_schema(schema=schemas.LoginResponse, data=user, extra_data={"access_token": access_token})
 
 
     async def login_user(self, data: schemas.LoginRequest, commons: CommonsDependencies) -> schemas.LoginResponse:
-        user = await user_controllers.login(email=data.email, password=data.password, commons=commons)
-        extra_data = {}
-        extra_data["access_token"] = await self.service.create_access_token(user_id=user.id, user_type=user.type)
-        return self.convert_orm_to_schema(schema=schemas.LoginResponse, data=user, extra_data=extra_data)
+        user = await user_controllers.authenticate(email=data.email, commons=commons)
+        # The password check runs in a worker thread, so sign the token while it is in progress.
+        # If the password is wrong, gather re-raises the error and the token is never returned.
+        _, access_token = await asyncio.gather(
+            user_controllers.verify_password(user=user, password=data.password),
+            self.service.create_access_token(user_id=user.id, user_type=user.type, cache=False),
+        )
+        # Only tokens of verified logins are cached, so failed logins cannot fill and flush the cache
+        self.service.cache_access_token(user_id=user.id, user_type=user.type, access_token=access_token)
+        return self.convert_orm_to_schema(schema=schemas.LoginResponse, data=user, extra_data={"access_token": access_token})
 
 
 auth_controllers = AuthControllers(controller_name="auth", service=auth_services)
@@ -2,7 +2,6 @@ import functools
 from typing import Any, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.dependencies import CommonsDependencies
-from utils import value
 
 from .exceptions import AuthErrorCode
 from .services import auth_services
@@ -50,7 +49,7 @@ class access_control:
                 commons.is_public_api = False
             else:
                 commons.is_public_api = True
-            if cls.admin and commons.user_type != value.UserRoles.ADMIN.value:
+            if cls.admin and not commons.is_admin():
                 raise AuthErrorCode.Forbidden()
             return await function(*args, **kwargs)
 
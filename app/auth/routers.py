@@ -1,5 +1,5 @@
 from auth.decoractor import access_control
-from core.dependencies import CommonsDependencies
+from core.dependencies import CommonsDependencies, body_openapi, parse_body
 from fastapi import Depends
 from fastapi_restful.cbv import cbv
 from fastapi_restful.inferring_router import InferringRouter
@@ -17,14 +17,24 @@ router = InferringRouter(
 class RoutersCBV:
     commons: CommonsDependencies = Depends(CommonsDependencies)  # type: ignore
 
-    @router.post("/auth/register", status_code=201, responses={201: {"model": schemas.LoginResponse, "description": "Register user success"}})
+    @router.post(
+        "/auth/register",
+        status_code=201,
+        responses={201: {"model": schemas.LoginResponse, "description": "Register user success"}},
+        openapi_extra=body_openapi(schemas.RegisterRequest),
+    )
     @access_control(public=True)
-    async def register(self, data: schemas.RegisterRequest):
+    async def register(self, data: schemas.RegisterRequest = Depends(parse_body(schemas.RegisterRequest, error_overrides=schemas.REGISTER_ERROR_OVERRIDES))):
         result = await auth_controllers.register_user(data=data, commons=self.commons)
         return schemas.LoginResponse.model_validate(result)
 
-    @router.post("/auth/login", status_code=201, responses={201: {"model": schemas.LoginResponse, "description": "Register user success"}})
+    @router.post(
+        "/auth/login",
+        status_code=201,
+        responses={201: {"model": schemas.LoginResponse, "description": "Register user success"}},
+        openapi_extra=body_openapi(schemas.LoginRequest),
+    )
     @access_control(public=True)
-    async def login(self, data: schemas.LoginRequest):
+    async def login(self, data: schemas.LoginRequest = Depends(parse_body(schemas.LoginRequest))):
         result = await auth_controllers.login_user(data=data, commons=self.commons)
         return schemas.LoginResponse.model_validate(result)
@@ -1,31 +1,33 @@
-from typing import Optional
+from typing import Annotated, Optional
 
 from core.schemas import EmailStr, PhoneStr
-from pydantic import BaseModel, field_validator, ConfigDict
+from pydantic import BaseModel, ConfigDict, StringConstraints
 from users import schemas as user_schemas
 from users.config import settings as user_settings
 from users.exceptions import UserErrorCode
 
+_MIN_PASSWORD_LENGTH = user_settings.minimum_length_of_the_password
+
 
 class RegisterRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     fullname: str
     email: EmailStr
     phone_number: Optional[PhoneStr] = None
-    password: str
+    # The length is checked by pydantic-core; `REGISTER_ERROR_OVERRIDES` maps its error back to ours
+    password: Annotated[str, StringConstraints(min_length=_MIN_PASSWORD_LENGTH)]
+
 
-    @field_validator("password")
-    @classmethod
-    def check_the_minimum_length_of_the_password(cls, v: str) -> str:
-        if len(v) < user_settings.minimum_length_of_the_password:
-            raise UserErrorCode.InvalidPasswordLength()
-        return v
+REGISTER_ERROR_OVERRIDES = {("password", "string_too_short"): UserErrorCode.InvalidPasswordLength}
 
 
 class LoginRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     email: EmailStr
     password: str
 
 
 class LoginResponse(user_schemas.Response):
+    model_config = ConfigDict(frozen=True, extra="forbid", from_attributes=True)
     access_token: str
     token_type: str = "bearer"
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from datetime import datetime
 
 from bcrypt import checkpw, gensalt, hashpw
@@ -12,24 +14,59 @@ from .config import settings
 class AuthServices(BaseServices):
     def __init__(self, service_name: str, crud: BaseCRUD = None) -> None:
         super().__init__(service_name, crud)
+        self._token_cache: dict[tuple[int, str], tuple[float, str]] = {}
 
-    async def create_access_token(self, user_id: int, user_type: str) -> dict:
+    async def create_access_token(self, user_id: int, user_type: str, cache: bool = True) -> dict:
         """
         Creates a JWT access token for the specified user.
 
+        Signed tokens are cached in memory per user and user type for `access_token_cache_seconds`,
+        so repeated logins within that window reuse the token instead of signing a new one.
+
         Args:
             user_id (str): The ID of the user for whom the token is being created.
             user_type (str): The type of the user (e.g., admin, customer).
+            cache (bool, optional): Whether to cache a newly signed token. Pass False while the user is not authenticated
+                yet, and cache the token with `cache_access_token` once they are. Defaults to True.
 
         Returns:
             str: The encoded JWT access token.
         """
+        cached = self._token_cache.get((user_id, user_type))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
         expire = calculator.add_days_to_datetime(days=settings.access_token_expire_day)
         expire_str = converter.convert_datetime_to_str(datetime_obj=expire)
         to_encode = {"user_id": user_id, "user_type": user_type, "expire": expire_str}
         encoded_jwt = jwt.encode(claims=to_encode, key=settings.secret_key, algorithm=settings.algorithm)
+        if cache:
+            self.cache_access_token(user_id=user_id, user_type=user_type, access_token=encoded_jwt)
         return encoded_jwt
 
+    def cache_access_token(self, user_id: int, user_type: str, access_token: str) -> None:
+        """
+        Caches a signed access token for `access_token_cache_seconds`, unless a token is already cached for the user.
+
+        Args:
+            user_id (int): The ID of the user the token was signed for.
+            user_type (str): The type of the user the token was signed for.
+            access_token (str): The encoded JWT access token.
+        """
+        if settings.access_token_cache_seconds <= 0:
+            return
+        key = (user_id, user_type)
+        now = time.monotonic()
+        cached = self._token_cache.get(key)
+        if cached and cached[0] > now:
+            return
+        if len(self._token_cache) >= settings.access_token_cache_size:
+            # Drop expired entries first, and start over if the cache is still full
+            self._token_cache = {k: v for k, v in self._token_cache.items() if v[0] > now}
+            if len(self._token_cache) >= settings.access_token_cache_size:
+                self._token_cache.clear()
+        self._token_cache[key] = (now + settings.access_token_cache_seconds, access_token)
+
     async def validate_access_token(self, token: str) -> bool:
         """
         Validates a JWT access token.
@@ -56,18 +93,22 @@ class AuthServices(BaseServices):
         """
         Hashes a given string using bcrypt.
 
+        The hashing runs in a worker thread so bcrypt's work factor does not block the event loop.
+
         Args:
             value (str): The string to be hashed.
 
         Returns:
             bytes: The hashed representation of the input string.
         """
-        return hashpw(value.encode("utf8"), gensalt())
+        return await asyncio.to_thread(hashpw, value.encode("utf8"), gensalt())
 
     async def validate_hash(self, value, hashed_value) -> bool:
         """
         Validates a given string against a hashed value using bcrypt.
 
+        Like `hash`, the comparison is offloaded to a worker thread.
+
         Args:
             value (str): The string to validate.
             hashed_value (bytes): The hashed value to compare against.
@@ -75,7 +116,7 @@ class AuthServices(BaseServices):
         Returns:
             bool: True if the string matches the hash, False otherwise.
         """
-        if not checkpw(value.encode("utf-8"), hashed_value):
+        if not await asyncio.to_thread(checkpw, value.encode("utf-8"), hashed_value):
             return False
         return True
 
@@ -1,8 +1,9 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
     ownership_field: str = "created_by"
-    fields_not_modified: list[str] = ["updated_at", "updated_by"]
+    fields_not_modified: frozenset[str] = frozenset({"updated_at", "updated_by"})
 
 settings = Settings()
@@ -1,6 +1,7 @@
+from operator import attrgetter
 from core.dependencies import CommonsDependencies
 from .services import BaseServices
-from typing import Type, TypeVar, Generic
+from typing import Awaitable, Callable, Type, TypeVar, Generic
 from pydantic import BaseModel
 from sqlmodel import SQLModel
 
@@ -8,6 +9,60 @@ NOT_DECLARED_SERVICE = "Service must be an instance of BaseServices. Maybe the s
 
 TService = TypeVar("TService")
 
+# Specialized converters keyed by (ORM model, schema), see `register_converter`
+CONVERTERS: dict[tuple[type[SQLModel], type[BaseModel]], Callable[..., BaseModel]] = {}
+
+
+def register_converter(model: type[SQLModel], schema: type[BaseModel], fields: tuple[str, ...] = None) -> Callable[..., BaseModel]:
+    """
+    Registers a specialized converter from an ORM model to a schema, used by `BaseControllers.convert_orm_to_schema`.
+
+    The converter reads the given fields with a single `attrgetter` call and builds the schema with `model_construct`,
+    skipping validation. Only register pairs whose values come from validated database rows.
+
+    Args:
+        model (type[SQLModel]): The ORM model class the data comes from.
+        schema (type[BaseModel]): The schema class to build.
+        fields (tuple[str, ...], optional): The fields copied from the ORM instance. Defaults to the schema fields
+            that are also columns of the model; the remaining schema fields come from `extra_data` or their defaults.
+
+    Returns:
+        Callable[..., BaseModel]: The converter, called as `converter(data, **extra_data)`.
+    """
+    if fields is None:
+        fields = tuple(field for field in schema.model_fields if field in model.model_fields)
+    get_values = attrgetter(*fields)
+    # attrgetter returns a bare value instead of a tuple for a single field
+    single_field = len(fields) == 1
+
+    def converter(data: SQLModel, **extra_data) -> BaseModel:
+        values = get_values(data)
+        if single_field:
+            values = (values,)
+        return schema.model_construct(**dict(zip(fields, values)), **extra_data)
+
+    CONVERTERS[(model, schema)] = converter
+    return converter
+
+
+class _AttributesView:
+    """
+    A read-only view over an ORM instance that overlays extra attributes, so `model_validate(from_attributes=True)`
+    can read both without mutating the instance or building an intermediate dictionary.
+    """
+
+    __slots__ = ("_data", "_extra_data")
+
+    def __init__(self, data: SQLModel, extra_data: dict) -> None:
+        self._data = data
+        self._extra_data = extra_data
+
+    def __getattr__(self, name: str):
+        if name in self._extra_data:
+            return self._extra_data[name]
+        return getattr(self._data, name)
+
+
 class BaseControllers(Generic[TService]):
     """
     A base class for controllers that provides common methods for interacting with services.
@@ -24,11 +79,18 @@ class BaseControllers(Generic[TService]):
         service (BaseServices): The service instance used for performing operations.
     """
 
+    __slots__ = ("controller_name", "service")
+
     def __init__(self, controller_name: str, service: TService = None) -> None:
+        # The service never changes after construction, so validate it once here instead of on every call
+        if service is not None and not isinstance(service, BaseServices):
+            raise TypeError(NOT_DECLARED_SERVICE)
         self.controller_name = controller_name
         self.service = service
 
-    async def get_all(
+    # The forwarders below return the service coroutine without awaiting it, so each call skips
+    # creating and suspending an extra coroutine frame. Callers still `await` them as before.
+    def get_all(
         self,
         query: dict = None,
         search: str = None,
@@ -38,11 +100,11 @@ class BaseControllers(Generic[TService]):
         sort_by: str = "created_at",
         order_by: str = "desc",
         include_deleted: bool = False,
+        cursor: str = None,
+        skip_count: bool = False,
         commons: CommonsDependencies = None,
-    ) -> dict:
-        if not isinstance(self.service, BaseServices):
-            raise TypeError(NOT_DECLARED_SERVICE)
-        results = await self.service.get_all(
+    ) -> Awaitable[dict]:
+        return self.service.get_all(
             query=query,
             search=search,
             search_in=search_in,
@@ -51,29 +113,21 @@ class BaseControllers(Generic[TService]):
             sort_by=sort_by,
             order_by=order_by,
             include_deleted=include_deleted,
+            cursor=cursor,
+            skip_count=skip_count,
             commons=commons,
         )
-        return results
 
-    async def get_by_id(self, _id: int, ignore_error: bool = False, include_deleted: bool = False, commons: CommonsDependencies = None) -> dict:
-        if not isinstance(self.service, BaseServices):
-            raise TypeError(NOT_DECLARED_SERVICE)
-        result = await self.service.get_by_id(_id=_id, ignore_error=ignore_error, include_deleted=include_deleted, commons=commons)
-        return result
+    def get_by_id(self, _id: int, ignore_error: bool = False, include_deleted: bool = False, commons: CommonsDependencies = None) -> Awaitable[dict]:
+        return self.service.get_by_id(_id=_id, ignore_error=ignore_error, include_deleted=include_deleted, commons=commons)
 
-    async def get_by_field(
+    def get_by_field(
         self, data: str, field_name: str, ignore_error: bool = False, include_deleted: bool = False, commons: CommonsDependencies = None
-    ) -> list:
-        if not isinstance(self.service, BaseServices):
-            raise TypeError(NOT_DECLARED_SERVICE)
-        result = await self.service.get_by_field(data=data, field_name=field_name, ignore_error=ignore_error, include_deleted=include_deleted, commons=commons)
-        return result
+    ) -> Awaitable[list]:
+        return self.service.get_by_field(data=data, field_name=field_name, ignore_error=ignore_error, include_deleted=include_deleted, commons=commons)
 
-    async def soft_delete_by_id(self, _id: int, ignore_error: bool = False, commons: CommonsDependencies = None) -> dict:
-        if not isinstance(self.service, BaseServices):
-            raise TypeError(NOT_DECLARED_SERVICE)
-        result = await self.service.soft_delete_by_id(_id=_id, ignore_error=ignore_error, commons=commons)
-        return result
+    def soft_delete_by_id(self, _id: int, ignore_error: bool = False, commons: CommonsDependencies = None) -> Awaitable[dict]:
+        return self.service.soft_delete_by_id(_id=_id, ignore_error=ignore_error, commons=commons)
 
     def get_current_user(self, commons: CommonsDependencies):
         return commons.current_user
@@ -83,21 +137,26 @@ class BaseControllers(Generic[TService]):
 
     def convert_orm_to_schema(self, schema: Type[BaseModel], data: SQLModel, extra_data: dict = None) -> BaseModel:
         """
-        Converts an ORM model (`SQLModel`) into a Pydantic schema (`BaseModel`), ensuring missing fields 
-        are handled properly and allowing additional fields to be added dynamically.
+        Converts an ORM model (`SQLModel`) into a Pydantic schema (`BaseModel`) in a single validation pass,
+        allowing additional fields to be added dynamically.
+
+        Only the fields declared on the schema are read from the instance, so columns the schema does not
+        expose (e.g. password, updated_at) are never serialized. If a converter was registered for the pair
+        with `register_converter`, it is used instead and no validation is performed.
 
         Args:
             schema (Type[BaseModel]): The target Pydantic schema to validate the data.
             data (SQLModel): The ORM model instance retrieved from the database.
-            extra_data (dict, optional): Additional key-value pairs to update the schema with.
+            extra_data (dict, optional): Additional key-value pairs to overlay on the instance attributes.
 
         Returns:
             BaseModel: An instance of the schema containing the original data and extra fields.
         """
-        # Convert ORM model to dictionary, excluding unset (None) fields
-        data_dict = data.model_dump()
-        # Merge extra data if provided
+        converter = CONVERTERS.get((type(data), schema))
+        if converter is not None:
+            return converter(data, **(extra_data or {}))
+        # Overlay extra data as attributes so the schema can read everything straight from the ORM instance
         if extra_data:
-            data_dict.update(extra_data)
-        # Validate the dictionary and return a Pydantic schema instance
-        return schema.model_validate(data_dict)
\ No newline at end of file
+            data = _AttributesView(data=data, extra_data=extra_data)
+        # Validate from attributes directly, without building an intermediate dictionary
+        return schema.model_validate(data, from_attributes=True)
\ No newline at end of file
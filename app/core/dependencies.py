@@ -1,8 +1,18 @@
+from datetime import datetime
+from typing import Awaitable, Callable, Type, TypeVar
+
 from fastapi import Request, Depends
+from fastapi.exceptions import RequestValidationError
+from starlette.datastructures import Headers
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from utils.value import UserRoles
 from db.engine import db_engine
 
+TSchema = TypeVar("TSchema", bound=BaseModel)
+
+_ADMIN_ROLE = UserRoles.ADMIN.value
+
 class CommonsDependencies:
     """
     Handles common dependencies extracted from the request.
@@ -19,21 +29,40 @@ class CommonsDependencies:
         current_user (str, None): The ID of the current user extracted from the request payload.
         user_type (str, None): The type of the current user (e.g., admin, customer) extracted from the request payload.
         is_public_api (bool, None): Indicates whether the request is from a public API, extracted from the request payload.
+        headers (Headers, dict): The request headers, read lazily from the request without copying them.
+        now (datetime): The time of the request, taken on first use so every record written by the request shares it.
     """
 
+    __slots__ = ("session", "current_user", "user_type", "is_public_api", "api_path", "_request", "_now")
+
     def __init__(self, request: Request = None, session: AsyncSession = Depends(db_engine.get_session)) -> None:
         self.session = session
         self.current_user = None
         self.user_type = None
         self.is_public_api = None
+        self.api_path = None
+        self._request = request
+        self._now = None
         if request:
             self.api_path = request.url.path
-            self.headers = dict(request.headers)
             if hasattr(request.state, "payload"):
                 self.current_user = request.state.payload.get("user_id")
                 self.user_type = request.state.payload.get("user_type")
                 self.is_public_api = request.state.payload.get("is_public_api")
 
+    @property
+    def headers(self) -> Headers | dict:
+        # Starlette's headers are already a case-insensitive mapping, so there is no need to copy them into a dict
+        if self._request is None:
+            return {}
+        return self._request.headers
+
+    @property
+    def now(self) -> datetime:
+        if self._now is None:
+            self._now = datetime.now()
+        return self._now
+
     def is_admin(self) -> bool:
         """
         Checks if the current user is an admin.
@@ -41,8 +70,56 @@ class CommonsDependencies:
         Returns:
             bool: True if the current user is an admin, False otherwise.
         """
-        return self.user_type == UserRoles.ADMIN.value if self.user_type else False
+        return self.user_type == _ADMIN_ROLE
     
     @classmethod
     def from_session(cls, session: AsyncSession):
-        return cls(request=None, session=session)
\ No newline at end of file
+        return cls(request=None, session=session)
+
+
+def parse_body(
+    schema: Type[TSchema], error_overrides: dict[tuple[str, str], Callable[[], Exception]] = None
+) -> Callable[[Request], Awaitable[TSchema]]:
+    """
+    Builds a dependency that parses and validates the raw request body with `model_validate_json`.
+
+    The JSON is decoded directly by pydantic-core in a single pass, instead of `json.loads` followed by `model_validate`.
+
+    Args:
+        schema (Type[TSchema]): The Pydantic schema used to validate the request body.
+        error_overrides (dict, optional): Maps a `(field, error type)` pair reported by pydantic-core to a factory
+            of the exception to raise instead, e.g. `{("password", "string_too_short"): UserErrorCode.InvalidPasswordLength}`.
+
+    Returns:
+        Callable[[Request], Awaitable[TSchema]]: A FastAPI dependency returning the validated schema instance.
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON or does not match the schema.
+    """
+
+    async def dependency(request: Request) -> TSchema:
+        try:
+            return schema.model_validate_json(await request.body())
+        except ValidationError as exc:
+            errors = exc.errors(include_url=False)
+            if error_overrides:
+                for error in errors:
+                    override = error_overrides.get((error["loc"][0] if error["loc"] else None, error["type"]))
+                    if override:
+                        raise override()
+            raise RequestValidationError(errors=[{**error, "loc": ("body", *error["loc"])} for error in errors])
+
+    return dependency
+
+
+def body_openapi(schema: Type[BaseModel]) -> dict:
+    """
+    Describes a request body parsed by `parse_body`, so it still shows up in the OpenAPI documentation.
+
+    Args:
+        schema (Type[BaseModel]): The Pydantic schema of the request body.
+
+    Returns:
+        dict: The value for the `openapi_extra` argument of a route.
+    """
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema.model_json_schema()}}}}
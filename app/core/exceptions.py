@@ -32,6 +32,12 @@ class CoreErrorCode:
             type="core/info/invalid-date", status=400, title="Invalid date format.", detail=f"The {date} is not a valid date. Please provide a valid date with YYYY-MM-DD format and try again."
         )
 
+    @staticmethod
+    def InvalidCursor(cursor: str):
+        return CustomException(
+            type="core/info/invalid-cursor", status=400, title="Invalid cursor.", detail=f"The {cursor} is not a valid cursor. Please use the next_cursor of a previous page and try again."
+        )
+
     @staticmethod
     def Unauthorize():
         return CustomException(type="core/warning/unauthorize", status=401, title="Unauthorize.", detail="Could not authorize credentials")
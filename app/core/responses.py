@@ -0,0 +1,17 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class ModelJSONResponse(JSONResponse):
+    """
+    A JSON response rendered by pydantic-core's serializer instead of the standard `json` module.
+
+    Pydantic models (including those built with `model_construct`), datetimes and the other types the schemas use
+    are serialized natively, so a route can return this response with a schema instance as content and skip
+    FastAPI's `jsonable_encoder` pass entirely.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
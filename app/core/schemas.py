@@ -1,4 +1,6 @@
+import re
 from datetime import datetime
+from functools import cached_property
 from typing import Annotated
 
 from fastapi import Query, Request
@@ -8,6 +10,8 @@ from utils.value import OrderBy, UserRoles
 
 from .exceptions import CoreErrorCode
 
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
 class PaginationParams:
     """
     Handles pagination parameters extracted from the request query parameters.
@@ -23,6 +27,8 @@ class PaginationParams:
         fields (str, optional): A comma-separated list of fields to include in the response. Defaults to None.
         sort_by (str, optional): The field by which to sort the results. Defaults to "created_at".
         order_by (OrderBy, optional): The order in which to sort the results, either ascending or descending. Defaults to descending.
+        cursor (str, optional): The `next_cursor` of a previous page, used instead of `page` for keyset pagination. Defaults to None.
+        skip_count (bool, optional): Whether to skip counting the matching records, returning -1 as the total items and pages. Defaults to False.
 
     Attributes:
         query (dict): A dictionary of query parameters extracted from the request.
@@ -31,7 +37,9 @@ class PaginationParams:
         limit (int): The number of records per page.
         fields (str): The fields to include in the response.
         sort_by (str): The field by which to sort the results.
-        order_by (OrderBy): The order in which to sort the results.
+        order_by (str): The order in which to sort the results, "desc" or "asc".
+        cursor (str): The cursor of the page to fetch.
+        skip_count (bool): Whether to skip counting the matching records.
     """
 
     def __init__(
@@ -42,13 +50,22 @@ class PaginationParams:
         limit: int = Query(default=20, gt=0),
         sort_by: str = Query("created_at", description="Anything you want"),
         order_by: OrderBy = Query(OrderBy.DECREASE.value, description="desc: Descending | asc: Ascending"),
+        cursor: str = Query(None, description="The next_cursor of the previous page, faster than page for deep pages"),
+        skip_count: bool = Query(False, description="Skip counting the matching records; total_items and total_page are then -1"),
     ):
-        self.query = dict(request.query_params)
+        self._query_params = request.query_params
         self.search = search
         self.page = page
         self.limit = limit
         self.sort_by = sort_by
-        self.order_by = order_by
+        self.order_by = order_by.value
+        self.cursor = cursor
+        self.skip_count = skip_count
+
+    @cached_property
+    def query(self) -> dict:
+        # Copy the query parameters only when they are actually read, and skip the copy when there are none
+        return dict(self._query_params) if self._query_params else {}
 
 def check_email(value: str) -> str:
     """
@@ -100,8 +117,12 @@ def check_date_format(value: str) -> str:
         CoreErrorCode.InvalidDate: If the string does not match the date format "%Y-%m-%d".
 
     """
+    # Match the shape with a precompiled regex, then let datetime check the calendar date (cheaper than strptime)
+    matched = _DATE_RE.fullmatch(value)
+    if not matched:
+        raise CoreErrorCode.InvalidDate(date=value)
     try:
-        datetime.strptime(value, "%Y-%m-%d")
+        datetime(int(matched[1]), int(matched[2]), int(matched[3]))
         return value
     except ValueError:
         raise CoreErrorCode.InvalidDate(date=value)
@@ -4,12 +4,13 @@ from config import settings as root_settings
 from db.base import BaseCRUD
 from pydantic import BaseModel
 from pydantic._internal._model_construction import ModelMetaclass
-from utils import value
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import SQLModel
+from utils.converter import convert_to_tuple
 from .config import settings
 from .exceptions import CoreErrorCode
 from .dependencies import CommonsDependencies
-from typing import Generic, List, Type, TypeVar, Union, Any, Dict
+from typing import Generic, List, Optional, Type, TypeVar, Union, Any, Dict
 
 TModel = TypeVar("TModel", bound=BaseModel)
 
@@ -18,8 +19,9 @@ TModel = TypeVar("TModel", bound=BaseModel)
 # Because it is a generic class that can be used to define the structure of the response for any model.
 class GetAllModel(BaseModel):
     total_items: int
-    total_pages: int
+    total_page: int
     records_per_page: int
+    next_cursor: Optional[str] = None
     results: List[BaseModel]
 
 
@@ -95,25 +97,15 @@ class BaseServices(Generic[TModel]):
             dict | None: A dictionary representing the ownership query, or None if no ownership query is needed.
 
         """
-        if not commons:
-            return None
-        current_user_id = self.get_current_user(commons=commons)
-        if not current_user_id:
-            return None
-
-        current_user_type = self.get_current_user_type(commons=commons)
-        if current_user_type == value.UserRoles.ADMIN.value:
+        if not commons or not commons.current_user or commons.is_admin():
             return None
+        return {self.ownership_field: commons.current_user}
 
-        query = {}
-        query[self.ownership_field] = current_user_id
-        return query
-    
     def _build_query(self, commons: CommonsDependencies = None, query: Dict[str, Any] = None, include_deleted: bool = False) -> dict:
-        if not query:
-            query = {}
+        # Copy into a new dict so the caller's query is never mutated
+        query = {**query} if query else {}
         if not include_deleted:
-            query.update({"deleted_at": None})
+            query["deleted_at"] = None
 
         # Enhance owner user query
         ownership_query = self._build_ownership_query(commons=commons)
@@ -121,6 +113,21 @@ class BaseServices(Generic[TModel]):
             query.update(ownership_query)
         return query
 
+    def _records_cache(self, commons: CommonsDependencies) -> Dict[tuple, Dict[tuple, SQLModel]]:
+        """
+        Gets the records already looked up by ID during the request, stored on its database session.
+
+        Returns:
+            dict: The records by (service name, ID), then by the query used to look them up.
+        """
+        return commons.session.info.setdefault("records_by_id", {})
+
+    def _forget_record(self, _id: int, commons: CommonsDependencies) -> None:
+        """
+        Drops a record from the request's lookup cache after it was written.
+        """
+        self._records_cache(commons=commons).pop((self.service_name, _id), None)
+
     async def get_by_id(self, _id: int, commons: CommonsDependencies, ignore_error: bool = False, include_deleted: bool = False) -> SQLModel:
         """
         Retrieves a record by its ID.
@@ -139,7 +146,15 @@ class BaseServices(Generic[TModel]):
 
         """
         query = self._build_query(commons=commons, include_deleted=include_deleted)
-        item = await self.crud.get_by_id(session=commons.session, _id=_id, query=query)
+
+        # A request often looks up the same record several times, so reuse the first lookup
+        records_cache = self._records_cache(commons=commons)
+        query_key = tuple(query.items())
+        item = records_cache.get((self.service_name, _id), {}).get(query_key)
+        if item is None:
+            item = await self.crud.get_by_id(session=commons.session, _id=_id, query=query)
+            if item:
+                records_cache.setdefault((self.service_name, _id), {})[query_key] = item
         if not item and not ignore_error:
             raise CoreErrorCode.NotFound(service_name=self.service_name, item=_id)
         return item
@@ -154,7 +169,9 @@ class BaseServices(Generic[TModel]):
         limit: int = 20,
         sort_by: str = "created_at",
         order_by: str = "desc",
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        cursor: str = None,
+        skip_count: bool = False,
     ) -> GetAllModel:
         """
         Retrieves all records based on the provided query parameters.
@@ -168,16 +185,36 @@ class BaseServices(Generic[TModel]):
             sort_by (str, optional): The field to sort the results by. Defaults to "created_at".
             order_by (str, optional): The sort order, either "asc" or "desc". Defaults to "desc".
             include_deleted (bool, optional): Whether to include soft-deleted records. Defaults to False.
+            cursor (str, optional): The `next_cursor` of a previous page, to continue right after it instead of using `page`. Defaults to None.
+            skip_count (bool, optional): Whether to skip counting the matching records, returning -1 as the total items and pages. Defaults to False.
             commons (CommonsDependencies, optional): Common dependencies for the request. Defaults to None.
 
         Returns:
             GetAllModel: A dictionary containing the retrieved records and additional metadata.
 
+        Raises:
+            CoreErrorCode.InvalidCursor: If the cursor is malformed or was issued for other sort options.
+
         """
         query = self._build_query(commons=commons, query=query, include_deleted=include_deleted)
 
-        results = await self.crud.get_all(session=commons.session, query=query, search=search, search_in=search_in, page=page, limit=limit, sort_by=sort_by, order_by=order_by)
-        return GetAllModel(total_items=results["total_items"], total_pages=results["total_pages"], records_per_page=results["records_per_page"], results=results["results"])
+        decoded_cursor = None
+        if cursor:
+            decoded_cursor = self.crud.decode_cursor(cursor=cursor, sort_by=sort_by, order_by=order_by)
+            if decoded_cursor is None:
+                raise CoreErrorCode.InvalidCursor(cursor=cursor)
+
+        results = await self.crud.get_all(
+            session=commons.session, query=query, search=search, search_in=search_in, page=page, limit=limit, sort_by=sort_by, order_by=order_by, cursor=decoded_cursor,
+            skip_count=skip_count,
+        )
+        return GetAllModel(
+            total_items=results["total_items"],
+            total_page=results["total_page"],
+            records_per_page=results["records_per_page"],
+            next_cursor=results["next_cursor"],
+            results=results["results"],
+        )
 
     async def get_by_field(
         self, data: str, field_name: str, commons: CommonsDependencies, ignore_error: bool = False, include_deleted: bool = False) -> list[SQLModel]:
@@ -205,36 +242,18 @@ class BaseServices(Generic[TModel]):
             raise CoreErrorCode.NotFound(service_name=self.service_name, item=data)
         return items
 
-    async def _check_unique(self, data: SQLModel, unique_field: str | list, ignore_error: bool = False) -> bool:
+    def _unique_value(self, data: TModel, unique_field: tuple) -> Any:
         """
-        Checks if a field or set of fields is unique within the database.
+        Gets the value of the first unique field, to report it in a conflict error.
 
         Args:
-            data (SQLModel): The data to check for uniqueness.
-            unique_field (str | list): The field or fields to check for uniqueness.
-            ignore_error (bool, optional): Whether to ignore errors if a conflict is found. Defaults to False.
+            data (TModel): The data that caused the conflict.
+            unique_field (tuple): The fields that must be unique in the database.
 
         Returns:
-            bool: True if the field or fields are unique, False otherwise.
-
-        Raises:
-            CoreErrorCode.Conflict: If a conflict is detected and `ignore_error` is False.
-
+            Any: The value of the first unique field.
         """
-        unique_field = [unique_field] if type(unique_field) is str else unique_field
-        query = {}
-        for field in unique_field:
-            if getattr(data, field):
-                query[field] = getattr(data, field)
-        if not query:
-            return False
-        total_items = await self.crud.count_documents(query=query)
-        if total_items == 0:
-            return True
-        if ignore_error:
-            return False
-        first_item = next(iter(query.values()))
-        raise CoreErrorCode.Conflict(service_name=self.service_name, item=first_item)
+        return getattr(data, unique_field[0], None)
 
     async def save(self, data: TModel, commons: CommonsDependencies) -> TModel:
         """
@@ -263,7 +282,9 @@ class BaseServices(Generic[TModel]):
         results = await self.crud.save_many(session=commons.session, data=data)
         return results
     
-    async def save_unique(self, data: TModel, unique_field: str | list, commons: CommonsDependencies, ignore_error: bool = False) -> bool | TModel:
+    async def save_unique(
+        self, data: TModel, unique_field: str | list, commons: CommonsDependencies, ignore_error: bool = False, self_references: str | list = ()
+    ) -> bool | TModel:
         """
         Saves a new record to the database, ensuring that specified fields are unique. 
 
@@ -271,6 +292,8 @@ class BaseServices(Generic[TModel]):
             data (TModel): The data to be saved.
             unique_field (str | list): The field or fields that must be unique in the database.
             ignore_error (bool, optional): Whether to ignore errors if a conflict is found. Defaults to False.
+            self_references (str | list, optional): The field or fields set to the ID of the new record itself, e.g. `created_by`
+                for a user registering themselves.
 
         Returns:
             bool | TModel: The saved record, retrieved by its ID.
@@ -278,42 +301,28 @@ class BaseServices(Generic[TModel]):
         Raises:
             CoreErrorCode.Conflict: If a conflict is detected and `ignore_error` is False.
         """
-        result = await self.crud.save_unique(session=commons.session, data=data, unique_field=unique_field)
+        unique_field = convert_to_tuple(unique_field)
+        result = await self.crud.save_unique(session=commons.session, data=data, unique_field=unique_field, self_references=self_references)
         if not result:
             if ignore_error:
                 return False
             else:
-                if isinstance(unique_field, list):
-                    unique_value = getattr(data, unique_field[0])
-                else:
-                    unique_value = getattr(data, unique_field)
-                raise CoreErrorCode.Conflict(service_name=self.service_name, item=unique_value)
+                raise CoreErrorCode.Conflict(service_name=self.service_name, item=self._unique_value(data=data, unique_field=unique_field))
         return result
 
-    async def _check_modified(self, old_data: TModel, new_data: TModel, ignore_error: bool) -> bool:
+    def _modified_values(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Checks if the new data is different from the old data.
+        Gets the values that must differ from the stored record for an update to count as a modification.
+
         Args:
-            old_data (TModel): The old data to compare against.
-            new_data (TModel): The new data to compare.
-            ignore_error (bool): Whether to ignore errors if the data is not modified.
+            payload (dict): The dumped values to write.
+
         Returns:
-            bool: True if the data is modified, False otherwise.
+            dict: The values of the fields to compare, skipping audit fields and unset (None) values.
         """
-        for field in new_data.model_fields:
-            if field in ["updated_at", "updated_by"] or getattr(new_data, field) is None:
-                continue
-
-            new_val = getattr(new_data, field, None)
-            old_val = getattr(old_data, field, None)
-
-            if new_val != old_val:
-                return True
+        excluded = settings.fields_not_modified
+        return {field: value for field, value in payload.items() if value is not None and field not in excluded}
 
-        if ignore_error:
-            return False
-        raise CoreErrorCode.NotModified(service_name=self.service_name)
-    
     async def update_by_id(
         self, _id: int, data: TModel, commons: CommonsDependencies, unique_field: str | list = None, check_modified: bool = True, ignore_error: bool = False, include_deleted: bool = False) -> TModel | None:
         """
@@ -322,7 +331,7 @@ class BaseServices(Generic[TModel]):
         Args:
             _id (int): The ID of the record to update.
             data (TModel): The new data to update the record with.
-            unique_field (str | list, optional): The field or fields that must be unique in the database. Defaults to None.
+            unique_field (str | list, optional): The field or fields that must be unique in the database, enforced by their unique index. Defaults to None.
             check_modified (bool, optional): Whether to check if the data has been modified before updating. Defaults to True.
             ignore_error (bool, optional): Whether to ignore errors if the record is not found or not modified. Defaults to False.
             include_deleted (bool, optional): Whether to include soft-deleted records in the update. Defaults to False.
@@ -338,12 +347,29 @@ class BaseServices(Generic[TModel]):
 
         """
         query = self._build_query(commons=commons, include_deleted=include_deleted)
+        # Dump once: only the explicitly set fields are written, and only the written fields are checked for modification
+        values = data.model_dump(exclude_unset=True)
+        distinct_from = self._modified_values(payload=values) if check_modified else None
+        self._forget_record(_id=_id, commons=commons)
+        try:
+            item = await self.crud.update_by_id(session=commons.session, _id=_id, data=values, query=query, distinct_from=distinct_from)
+        except IntegrityError:
+            # The unique index is the uniqueness check, so a duplicate surfaces here instead of in an extra query.
+            if not unique_field:
+                raise
+            unique_field = convert_to_tuple(unique_field)
+            await commons.session.rollback()
+            if ignore_error:
+                return None
+            raise CoreErrorCode.Conflict(service_name=self.service_name, item=self._unique_value(data=data, unique_field=unique_field))
+        if item:
+            return item
+
+        # Nothing was updated, find out whether the record is missing or just not modified
         item = await self.get_by_id(_id=_id, commons=commons, ignore_error=ignore_error, include_deleted=include_deleted)
-        if check_modified:
-            await self._check_modified(old_data=item, new_data=data, ignore_error=ignore_error)
-        if unique_field:
-            await self._check_unique(data=data, unique_field=unique_field, ignore_error=ignore_error)
-        return await self.crud.update_by_id(session=commons.session, _id=_id, data=data, query=query)
+        if item and not ignore_error:
+            raise CoreErrorCode.NotModified(service_name=self.service_name)
+        return item
 
     async def hard_delete_by_id(self, _id: int, commons: CommonsDependencies, ignore_error: bool = False, include_deleted: bool = False) -> bool:
         """
@@ -363,6 +389,7 @@ class BaseServices(Generic[TModel]):
 
         """
         query = self._build_query(commons=commons, include_deleted=include_deleted)
+        self._forget_record(_id=_id, commons=commons)
         result = await self.crud.delete_by_id(session=commons.session, _id=_id, query=query)
         if not result:
             if not ignore_error:
@@ -381,11 +408,17 @@ class BaseServices(Generic[TModel]):
 
         Returns:
             dict: The updated record with the soft delete information.
+
+        Raises:
+            CoreErrorCode.NotFound: If the record is not found (or already deleted) and `ignore_error` is False.
         """
         if getattr(self.crud.model, "deleted_at", None) is None or getattr(self.crud.model, "deleted_by", None) is None:
             raise AttributeError("The model must have a 'deleted_at' field to support soft deletions")
-        data = self.crud.model()
-        data.deleted_at = self.get_current_datetime()
-        data.deleted_by = self.get_current_user(commons=commons)
-        result = await self.update_by_id(_id=_id, data=data, commons=commons, ignore_error=ignore_error)
+        query = self._build_query(commons=commons)
+        self._forget_record(_id=_id, commons=commons)
+        result = await self.crud.soft_delete_by_id(
+            session=commons.session, _id=_id, deleted_at=commons.now, deleted_by=commons.current_user, query=query
+        )
+        if not result and not ignore_error:
+            raise CoreErrorCode.NotFound(service_name=self.service_name, item=_id)
         return result
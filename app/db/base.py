@@ -1,9 +1,84 @@
 from sqlmodel import SQLModel, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Union, Any, Optional, Dict
-from sqlalchemy import asc, desc
+from sqlalchemy.orm import load_only
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from sqlalchemy import and_, asc, delete, desc, false, insert, literal, or_, true, tuple_, update
+from datetime import datetime
+import asyncio
+import base64
+import binascii
+import json
 import re
 import math
+import operator
+
+from utils.converter import convert_to_tuple
+
+_SPECIAL_CHARS_RE = re.compile(r"([*+?^${}()|[\]\\])")
+_LIKE_SPECIAL_CHARS_RE = re.compile(r"([\\%_])")
+_BOOL_MAP = {"false": False, "true": True}
+# Types of the columns that can be sorted on, since their values are carried by pagination cursors
+_CURSOR_TYPES = (bool, int, float, str, datetime)
+
+
+def _python_type(column_type: Any) -> Optional[type]:
+    # Type decorators such as SQLModel's AutoString do not report a Python type, the type they wrap does
+    for type_ in (column_type, getattr(column_type, "impl_instance", None)):
+        try:
+            return type_.python_type
+        except (AttributeError, NotImplementedError):
+            continue
+    return None
+
+
+def _iter_items(container: Union[dict, list]) -> Iterator[Tuple[Any, Any]]:
+    return iter(container.items()) if isinstance(container, dict) else iter(enumerate(container))
+
+
+def _map_strings(value: Union[dict, list, str, Any], func: Callable[[str], Any]) -> Union[dict, list, str, Any]:
+    """
+    Applies a function to every string nested in dictionaries and lists.
+
+    The structure is walked with an explicit stack instead of recursion, and a dictionary or list is only copied
+    when at least one of its items changed; otherwise the original object is returned.
+
+    Args:
+        value (dict | list | str | Any): The data structure to walk.
+        func (Callable[[str], Any]): The function applied to each string.
+
+    Returns:
+        dict | list | str | Any: The data structure with the function applied to its strings.
+    """
+    if isinstance(value, str):
+        return func(value)
+    if not isinstance(value, (dict, list)):
+        return value
+
+    # Each frame holds: the container, its remaining items, the converted (key, item) pairs, whether any item changed
+    # and the key of the container in its parent.
+    stack = [[value, _iter_items(value), [], False, None]]
+    while True:
+        frame = stack[-1]
+        for key, item in frame[1]:
+            if isinstance(item, (dict, list)):
+                stack.append([item, _iter_items(item), [], False, key])
+                break
+            new_item = func(item) if isinstance(item, str) else item
+            frame[2].append((key, new_item))
+            frame[3] = frame[3] or new_item is not item
+        else:
+            stack.pop()
+            container, _, pairs, changed, key = frame
+            if changed:
+                container = dict(pairs) if isinstance(container, dict) else [item for _, item in pairs]
+            if not stack:
+                return container
+            parent = stack[-1]
+            parent[2].append((key, container))
+            parent[3] = parent[3] or changed
+
 
 class BaseCRUD:
     """
@@ -11,16 +86,30 @@ class BaseCRUD:
 
     Attributes:
         model (Type[SQLModel]): The SQLModel class representing the database table.
+        list_columns (list, None): The columns loaded by `get_all`, or None to load every column.
     """
 
-    def __init__(self, model: type[SQLModel]) -> None:
+    def __init__(self, model: type[SQLModel], columns: Optional[List[Any]] = None) -> None:
         """
         Initialize the CRUD class with the model.
 
         Args:
             model (Type[SQLModel]): The SQLModel class.
+            columns (list, optional): The column attributes loaded by `get_all`, e.g. the fields of the list response.
+                The other columns are left unloaded and must not be read from the listed records. Defaults to all columns.
         """
         self.model = model
+        self.list_columns = columns
+        # Column attributes by name, so filters look them up in a dict instead of going through hasattr/getattr
+        self._columns = {column.key: getattr(model, column.key) for column in model.__table__.columns}
+        # Sortable columns by name, with their Python type and whether they may hold NULL
+        self._sortable_columns = {}
+        for column in model.__table__.columns:
+            python_type = _python_type(column.type)
+            if python_type in _CURSOR_TYPES:
+                self._sortable_columns[column.key] = (python_type, column.nullable)
+        # Columns the database fills when an INSERT leaves them out
+        self._generated_columns = {"id"} | {column.key for column in model.__table__.columns if column.server_default is not None}
 
     async def count(self, session: AsyncSession) -> int:
         """
@@ -32,9 +121,8 @@ class BaseCRUD:
         Returns:
             int: The total count of records.
         """
-        statement = select(self.model)
-        result = await session.exec(statement)
-        return len(result.all())
+        statement = select(func.count()).select_from(self.model)
+        return await session.scalar(statement)
 
     def convert_bools(self, value: Union[dict, list, str, Any]) -> Union[dict, list, str, Any]:
         """
@@ -47,15 +135,7 @@ class BaseCRUD:
         Returns:
             dict | list | str | Any: The data structure with boolean string values converted to actual booleans.
         """
-        bool_map = {"false": False, "true": True}
-
-        if isinstance(value, dict):
-            return {key: self.convert_bools(val) for key, val in value.items()}
-        elif isinstance(value, list):
-            return [self.convert_bools(item) for item in value]
-        elif isinstance(value, str):
-            return bool_map.get(value.lower(), value)
-        return value
+        return _map_strings(value, lambda string: _BOOL_MAP.get(string.lower(), string))
 
     def replace_special_chars(self, value: Union[dict, str, Any]) -> Union[dict, str, Any]:
         """
@@ -71,20 +151,7 @@ class BaseCRUD:
             dict | str | Any: The input dictionary with all string values having special characters escaped,
                               or a single string with special characters escaped using a backslash.
         """
-        pattern = r"([*+?^${}()|[\]\\])"
-
-        if isinstance(value, dict):
-            return {
-                key: self.replace_special_chars(val)
-                for key, val in value.items()
-            }
-        elif isinstance(value, list):
-            return [self.replace_special_chars(item) for item in value]
-        elif isinstance(value, str):
-            return re.sub(pattern, r"\\\1", value)
-        
-        # Return unchanged for non-string, non-dict, non-list values
-        return value
+        return _map_strings(value, lambda string: _SPECIAL_CHARS_RE.sub(r"\\\1", string))
     
     def build_query_filters(self, _id: int, query: Dict[str, Any]) -> List[Any]:
         """
@@ -101,28 +168,89 @@ class BaseCRUD:
 
         if query:
             filters.extend([
-                getattr(self.model, key) == value
+                self._columns[key] == value
                 for key, value in query.items()
-                if hasattr(self.model, key)
+                if key in self._columns
             ])
 
         return filters
 
+    def _insert_values(self, data: SQLModel) -> Dict[str, Any]:
+        """
+        Dumps a record into the values of an INSERT statement, leaving out an unset ID and other unset columns with a
+        server default so the database generates them.
+
+        Args:
+            data (SQLModel): The record to be inserted.
+
+        Returns:
+            dict: The column values of the record.
+        """
+        return {
+            key: value
+            for key, value in data.model_dump().items()
+            if key in self._columns and not (value is None and key in self._generated_columns)
+        }
+
+    def _next_id(self, session: AsyncSession) -> Any:
+        """
+        Builds an expression that takes the next ID of the table, the one the database would assign to a new record.
+
+        Args:
+            session (AsyncSession): The database session.
+
+        Returns:
+            Any: The SQL expression of the next ID.
+        """
+        if session.bind.dialect.name == "sqlite":
+            # SQLite assigns max(id) + 1 to an INTEGER PRIMARY KEY, and the statement runs under its write lock
+            return select(func.coalesce(func.max(self.model.id), 0) + 1).scalar_subquery()
+        return func.nextval(func.pg_get_serial_sequence(self.model.__tablename__, "id"))
+
+    def _insert_statement(self, session: AsyncSession, data: SQLModel, self_references: str | list | tuple = ()) -> Any:
+        """
+        Builds an INSERT of a record with the dialect of the session, so conflict clauses can be added to it.
+
+        Args:
+            session (AsyncSession): The database session.
+            data (SQLModel): The record to be inserted.
+            self_references (str | list | tuple, optional): The field or fields set to the ID of the inserted record itself.
+
+        Returns:
+            Any: The INSERT statement.
+        """
+        insert_func = sqlite_insert if session.bind.dialect.name == "sqlite" else pg_insert
+        values = self._insert_values(data=data)
+        self_references = convert_to_tuple(self_references)
+        if not self_references:
+            return insert_func(self.model).values(**values)
+
+        # Fill self references within the INSERT, instead of updating the record once its ID is known. The next ID is
+        # taken once in a subquery, and both the ID and the fields referencing it are set explicitly from it.
+        new_id = select(self._next_id(session=session).label("id")).subquery("new_id")
+        table_columns = self.model.__table__.columns
+        fields = [key for key in values if key != "id" and key not in self_references]
+        row = [literal(values[key], type_=table_columns[key].type) for key in fields]
+        row.extend([new_id.c.id] * (len(self_references) + 1))
+        # The WHERE clause keeps SQLite from parsing the ON CONFLICT that follows as a join constraint
+        return insert_func(self.model).from_select([*fields, "id", *self_references], select(*row).where(true()))
+
     async def save(self, session: AsyncSession, data: SQLModel) -> SQLModel:
         """
         Inserts a single record into the database.
 
         Args:
             session (AsyncSession): The database session.
-            data (dict): The data to be inserted.
+            data (SQLModel): The data to be inserted.
 
         Returns:
-            int: The ID of the inserted record.
+            SQLModel: The inserted record, as returned by the INSERT.
         """
-        session.add(data)
+        # Read the stored row back with RETURNING instead of refreshing the record with a second query
+        statement = insert(self.model).values(**self._insert_values(data=data)).returning(self.model)
+        record = await session.scalar(statement)
         await session.commit()
-        await session.refresh(data)
-        return data
+        return record
 
     async def save_many(self, session: AsyncSession, data: List[SQLModel]) -> List[SQLModel]:
         """
@@ -133,75 +261,100 @@ class BaseCRUD:
             data (List[SQLModel]): List of data dictionaries to insert.
 
         Returns:
-            List[int]: List of inserted record IDs.
+            List[SQLModel]: The inserted records, hydrated from a single INSERT ... RETURNING.
         """
-        session.add_all(data)
+        if not data:
+            return []
+        values = [self._insert_values(data=item) for item in data]
+        statement = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await session.scalars(statement, values)
+        records = result.all()
         await session.commit()
-        for obj in data:      
-            await session.refresh(obj)
-        return data
+        return records
     
-    async def save_unique(self, session: AsyncSession, data: SQLModel, unique_field: list | str) -> bool | SQLModel:
+    async def save_unique(
+        self, session: AsyncSession, data: SQLModel, unique_field: str | list | tuple, self_references: str | list | tuple = ()
+    ) -> bool | SQLModel:
         """
         Saves a record into the database if it does not already exist based on unique fields.
 
         Args:
             session (AsyncSession): The database session.
             data (SQLModel): The data to be inserted.
-            unique_field (list | str): The field or list of fields that should be unique.
+            unique_field (str | list | tuple): The field or fields that should be unique. They must be covered by a unique index.
+            self_references (str | list | tuple, optional): The field or fields set to the ID of the inserted record itself.
 
         Returns:
             bool | SQLModel: The inserted record if successful, or False if it already exists.
         """
-        # Build the uniqueness query
-        if isinstance(unique_field, list):
-            filters = [getattr(self.model, field) == getattr(data, field) for field in unique_field if field in data]
-        elif isinstance(unique_field, str):
-            filters = [getattr(self.model, unique_field) == getattr(data, unique_field)]
-        else:
-            raise ValueError("The type of unique_field must be list or str")
-
-        # Execute the uniqueness check
-        statement = select(self.model).where(*filters)
-        result = await session.exec(statement)
-        existing_record = result.first()
-
-        if existing_record:
-            return False
+        if not isinstance(unique_field, (str, list, tuple)):
+            raise ValueError("The type of unique_field must be str, list or tuple")
+        unique_field = convert_to_tuple(unique_field)
+
+        # Let the unique index reject duplicates, so the check and the insert are a single atomic statement
+        statement = (
+            self._insert_statement(session=session, data=data, self_references=self_references)
+            .on_conflict_do_nothing(index_elements=list(unique_field))
+            .returning(self.model)
+        )
+        record = await session.scalar(statement)
+        await session.commit()
+        return record if record is not None else False
 
-        return await self.save(session=session, data=data)
-    
     async def update_by_id(
-        self, session: AsyncSession, _id: int, data: SQLModel, query: Optional[Dict[str, Any]] = None) -> type[SQLModel] | None:
+        self, session: AsyncSession, _id: int, data: SQLModel | Dict[str, Any], query: Optional[Dict[str, Any]] = None, distinct_from: Optional[Dict[str, Any]] = None
+    ) -> type[SQLModel] | None:
         """
         Updates a record in the database based on its ID and optional query filters.
 
         Args:
             session (AsyncSession): The database session.
             _id (int): The ID of the record to be updated.
-            data (dict): The data to update in the record.
+            data (SQLModel | dict): The data to update in the record, either a model (only its set fields are written) or the values already dumped.
             query (dict, optional): Additional query criteria for the update operation.
+            distinct_from (dict, optional): Values of which at least one must differ from the stored record for it to be updated.
 
         Returns:
-            dict | None: The updated record as a dictionary if the update was successful, or None if the record doesn't exist.
+            dict | None: The updated record as a dictionary if the update was successful, or None if the record doesn't exist or is not modified.
         """
         # Build the initial query with the ID
         filters = self.build_query_filters(_id=_id, query=query)
 
-        # Execute the select query to check if the record exists
-        statement = select(self.model).where(*filters)
-        result = await session.exec(statement)
+        # Only match the record if the update would change it
+        if distinct_from is not None:
+            changes = [self._columns[key].is_distinct_from(value) for key, value in distinct_from.items() if key in self._columns]
+            filters.append(or_(*changes) if changes else false())
+
+        # Match, update and return the record in a single statement
+        if not isinstance(data, dict):
+            data = data.model_dump(exclude_unset=True)
+        values = {key: value for key, value in data.items() if key in self._columns}
+        if values:
+            statement = update(self.model).where(*filters).values(**values).returning(self.model)
+        else:
+            statement = select(self.model).where(*filters)
+        result = await session.scalars(statement.execution_options(populate_existing=True))
         record = result.one_or_none()
+        await session.commit()
+        return record  # None if the record does not exist or does not match query filters
 
-        if not record:
-            return None  # Record does not exist or does not match query filters
+    async def soft_delete_by_id(
+        self, session: AsyncSession, _id: int, deleted_at: datetime, deleted_by: Optional[int] = None, query: Optional[Dict[str, Any]] = None
+    ) -> type[SQLModel] | None:
+        """
+        Marks a record as deleted based on its ID and optional query filters, in a single UPDATE statement.
 
-        data = data.model_dump(exclude_unset=True)
-        record.sqlmodel_update(data)
-        session.add(record)
-        await session.commit()
-        await session.refresh(record)  # Refresh to get the updated data from the DB
-        return record
+        Args:
+            session (AsyncSession): The database session.
+            _id (int): The ID of the record to be soft deleted.
+            deleted_at (datetime): The time of the deletion.
+            deleted_by (int, optional): The ID of the user deleting the record.
+            query (dict, optional): Additional query criteria for the update operation.
+
+        Returns:
+            dict | None: The soft deleted record, or None if the record doesn't exist or does not match the query filters.
+        """
+        return await self.update_by_id(session=session, _id=_id, data={"deleted_at": deleted_at, "deleted_by": deleted_by}, query=query)
 
     async def delete_by_id(
         self, session: AsyncSession, _id: int, query: Optional[Dict[str, Any]] = None
@@ -219,16 +372,10 @@ class BaseCRUD:
         """
         filters = self.build_query_filters(_id=_id, query=query)
 
-        statement = select(self.model).where(*filters)
-        result = await session.exec(statement)
-        record = result.one_or_none()
-
-        if not record:
-            return False
-
-        await session.delete(record)
+        statement = delete(self.model).where(*filters).returning(self.model.id)
+        deleted_id = await session.scalar(statement)
         await session.commit()
-        return True
+        return deleted_id is not None
     
     async def get_by_id(
         self, session: AsyncSession, _id: int, query: Optional[Dict[str, Any]] = None
@@ -244,15 +391,18 @@ class BaseCRUD:
         Returns:
             dict | None: The retrieved record as a dictionary, or None if no record is found.
         """
+        # Plain ID lookups go through the identity map, skipping the SELECT when the record is already loaded
+        if not query or query == {"deleted_at": None}:
+            record = await session.get(self.model, _id)
+            if record is not None and query and getattr(record, "deleted_at", None) is not None:
+                return None
+            return record
+
         filters = self.build_query_filters(_id=_id, query=query)
 
         statement = select(self.model).where(*filters)
         result = await session.exec(statement)
-        record = result.one_or_none()
-        if record:
-            await session.refresh(record)
-            return record
-        return None
+        return result.one_or_none()
     
     async def get_by_field(
         self,
@@ -273,13 +423,13 @@ class BaseCRUD:
         Returns:
             list | None: The list of retrieved records as dictionaries, or None if no records are found.
         """
-        filters = [getattr(self.model, field_name) == data]
+        filters = [self._columns[field_name] == data]
 
         if query:
             filters.extend([
-                getattr(self.model, key) == value
+                self._columns[key] == value
                 for key, value in query.items()
-                if hasattr(self.model, key)
+                if key in self._columns
             ])
 
         statement = select(self.model).where(*filters)
@@ -288,6 +438,86 @@ class BaseCRUD:
 
         return records if records else None
     
+    def _sort_options(self, sort_by: Optional[str], order_by: Optional[str]) -> Tuple[Optional[str], str]:
+        """
+        Normalizes the sort options: an unknown or unsortable field sorts by ID only, and any order other than "desc" is "asc".
+        """
+        return (sort_by if sort_by in self._sortable_columns else None), ("desc" if order_by == "desc" else "asc")
+
+    def encode_cursor(self, record: SQLModel, sort_by: Optional[str] = None, order_by: Optional[str] = None) -> str:
+        """
+        Encodes the position of a record into an opaque cursor for keyset pagination.
+
+        Args:
+            record (SQLModel): The last record of the current page.
+            sort_by (str, optional): The field the results are sorted by.
+            order_by (str, optional): The sort order, "asc" or "desc".
+
+        Returns:
+            str: A URL-safe cursor holding the sort options, the sort value and the ID of the record.
+        """
+        sort_by, order_by = self._sort_options(sort_by=sort_by, order_by=order_by)
+        sort_value = getattr(record, sort_by) if sort_by else None
+        if isinstance(sort_value, datetime):
+            sort_value = sort_value.isoformat()
+        payload = {"sort_by": sort_by, "order_by": order_by, "value": sort_value, "id": record.id}
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    def decode_cursor(self, cursor: str, sort_by: Optional[str] = None, order_by: Optional[str] = None) -> Optional[Tuple[Any, int]]:
+        """
+        Decodes a cursor produced by `encode_cursor` for the same sort options.
+
+        Args:
+            cursor (str): The cursor received from the client.
+            sort_by (str, optional): The field the results are sorted by.
+            order_by (str, optional): The sort order, "asc" or "desc".
+
+        Returns:
+            tuple | None: The sort value and the ID of the last seen record, or None if the cursor is malformed,
+                was issued for other sort options or holds a value that does not match the sort field.
+        """
+        sort_by, order_by = self._sort_options(sort_by=sort_by, order_by=order_by)
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("sort_by") != sort_by or payload.get("order_by") != order_by:
+            return None
+        sort_value, _id = payload.get("value"), payload.get("id")
+        if type(_id) is not int:
+            return None
+        if sort_by is None:
+            return (None, _id) if sort_value is None else None
+
+        python_type, nullable = self._sortable_columns[sort_by]
+        if sort_value is None:
+            return (None, _id) if nullable else None
+        try:
+            if python_type is datetime:
+                sort_value = datetime.fromisoformat(sort_value)
+            elif python_type is float and type(sort_value) is int:
+                sort_value = float(sort_value)
+        except (ValueError, TypeError):
+            return None
+        # The value is bound against the column, so it must have the column's type
+        if type(sort_value) is not python_type:
+            return None
+        return sort_value, _id
+
+    async def _count_on_new_connection(self, session: AsyncSession, statement: Any) -> int:
+        """
+        Runs a count statement on its own connection from the pool, so it can run while the session is busy.
+
+        Args:
+            session (AsyncSession): The database session, whose engine provides the connection.
+            statement (Select): The count statement.
+
+        Returns:
+            int: The count.
+        """
+        async with session.bind.connect() as connection:
+            return await connection.scalar(statement)
+
     async def get_all(
         self,
         session: AsyncSession,
@@ -298,10 +528,15 @@ class BaseCRUD:
         limit: Optional[int] = None,
         sort_by: Optional[str] = None,
         order_by: Optional[str] = None,
+        cursor: Optional[Tuple[Any, int]] = None,
+        skip_count: bool = False,
     ) -> Dict[str, Any]:
         """
         Retrieves all records from the database based on various query, pagination, sorting, and field limitations.
 
+        When a cursor is given, the page starts right after the record it points to (keyset pagination) and `page`
+        is ignored, so the database seeks to the position instead of scanning and discarding the skipped rows.
+
         Args:
             session (AsyncSession): The database session.
             query (dict, optional): The query criteria for querying the collection.
@@ -311,57 +546,117 @@ class BaseCRUD:
             limit (int, optional): The number of documents per page.
             sort_by (str, optional): The field name to sort the results by.
             order_by (str, optional): The order to sort the results, either "asc" for ascending or "desc" for descending.
+            cursor (tuple, optional): The sort value and ID of the last seen record, as returned by `decode_cursor`.
+            skip_count (bool, optional): Whether to skip counting the matching records; the total items and pages are then -1.
 
         Returns:
-            dict: A dictionary containing the results, total number of items, total pages, and records per page.
+            dict: A dictionary containing the results, total number of items, total pages, records per page and the cursor of the next page.
         """
         filters = []
 
         # Apply query filters
         if query:
             filters.extend([
-                getattr(self.model, key) == value
+                self._columns[key] == value
                 for key, value in query.items()
-                if hasattr(self.model, key)
+                if key in self._columns
             ])
 
 
         # Apply search filters
         if search and search_in:
+            # Escape the LIKE wildcards so the search is matched literally, and build the pattern only once
+            escaped_search = _LIKE_SPECIAL_CHARS_RE.sub(r"\\\1", search)
+            pattern = f"%{escaped_search}%"
             search_conditions = [
-                getattr(self.model, field).ilike(f"%{search}%")
-                for field in search_in if hasattr(self.model, field)
+                self._columns[field].ilike(pattern, escape="\\")
+                for field in search_in if field in self._columns
             ]
             if search_conditions:
-                filters.append(func.or_(*search_conditions))
-
-        # Build the base select statement
-        statement = select(self.model).where(*filters)
-
-        # Apply sorting
-        if sort_by and hasattr(self.model, sort_by):
-            order_func = desc if order_by == "desc" else asc
-            statement = statement.order_by(order_func(getattr(self.model, sort_by)))
-
-        # Count total records
-        count_statement = select(func.count()).select_from(self.model).where(*filters)
-        total_records = await session.scalar(count_statement)
+                filters.append(or_(*search_conditions))
+
+        # Sort by the requested field, with the ID as a tie-breaker so the order (and the cursor) is stable
+        sort_by, order_by = self._sort_options(sort_by=sort_by, order_by=order_by)
+        order_func = desc if order_by == "desc" else asc
+        sort_columns = [self._columns[sort_by], self.model.id] if sort_by else [self.model.id]
+        order_clauses = [order_func(column) for column in sort_columns]
+        sort_nullable = bool(sort_by) and self._sortable_columns[sort_by][1]
+        if sort_nullable:
+            # Databases disagree on where NULLs sort, so put them last in both orders; the cursor relies on it
+            order_clauses[0] = order_clauses[0].nulls_last()
+
+        # Seek past the last seen record
+        count_filters = list(filters)
+        if cursor:
+            sort_value, last_id = cursor
+            seek = operator.lt if order_by == "desc" else operator.gt
+            if not sort_by:
+                filters.append(seek(self.model.id, last_id))
+            elif sort_value is None:
+                # Only the remaining NULLs come after a NULL, ordered by ID
+                filters.append(and_(sort_columns[0].is_(None), seek(self.model.id, last_id)))
+            elif sort_nullable:
+                # A row comparison with NULL is never true, so the NULLs sorted last are added explicitly
+                filters.append(or_(seek(tuple_(*sort_columns), tuple_(sort_value, last_id)), sort_columns[0].is_(None)))
+            else:
+                filters.append(seek(tuple_(*sort_columns), tuple_(sort_value, last_id)))
+
+        # Build the select statement. Without a cursor every row matches the count filters, so the total is
+        # counted by a window function in the same query instead of a second round-trip.
+        count_in_query = not cursor and not skip_count
+        columns = (self.model, func.count().over().label("total_items")) if count_in_query else (self.model,)
+        statement = select(*columns).where(*filters).order_by(*order_clauses)
+        if self.list_columns:
+            # The sort columns are read back to build the next cursor, so they are always loaded
+            statement = statement.options(load_only(*self.list_columns, *sort_columns))
+
+        # Apply pagination, fetching one extra row to know whether there is a next page
+        if limit:
+            if page and not cursor:
+                statement = statement.offset((page - 1) * limit)
+            statement = statement.limit(limit + 1)
+
+        # Stream the page from a server-side cursor instead of buffering the whole result before reading it
+        if limit:
+            statement = statement.execution_options(yield_per=limit + 1)
+
+        async def fetch_page() -> Tuple[List[SQLModel], Optional[int]]:
+            result = await session.stream(statement)
+            records, total_records = [], None
+            async for row in result:
+                records.append(row[0])
+                if count_in_query:
+                    total_records = row[1]
+            return records, total_records
+
+        count_statement = select(func.count()).select_from(self.model).where(*count_filters)
+        if count_in_query:
+            records, total_records = await fetch_page()
+        elif skip_count:
+            records, _ = await fetch_page()
+            total_records = -1
+        else:
+            # The page query cannot carry the count, so run it at the same time on another pooled connection
+            (records, _), total_records = await asyncio.gather(fetch_page(), self._count_on_new_connection(session=session, statement=count_statement))
 
-        # Apply pagination
-        if page and limit:
-            offset = (page - 1) * limit
-            statement = statement.offset(offset).limit(limit)
+        # Count total records separately when the page is empty
+        if total_records is None:
+            total_records = await session.scalar(count_statement)
 
-        # Execute the query
-        result = await session.exec(statement)
-        records = result.all()
+        has_next_page = bool(limit) and len(records) > limit
+        if has_next_page:
+            records = records[:limit]
 
         # Calculate pagination details
-        total_pages = math.ceil(total_records / limit) if limit else 1
+        if skip_count:
+            total_pages = -1
+        else:
+            total_pages = math.ceil(total_records / limit) if limit else 1
 
         return {
             "records_per_page": len(records),
             "total_items": total_records,
             "total_page": total_pages,
+            "next_cursor": self.encode_cursor(record=records[-1], sort_by=sort_by, order_by=order_by) if has_next_page else None,
             "results": records
         }
\ No newline at end of file
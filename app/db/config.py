@@ -3,5 +3,10 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     database_url: str
+    sql_echo: bool = False
+    db_pool_size: int = 30
+    db_max_overflow: int = 30
+    db_pool_recycle: int = 3600
+    db_pool_pre_ping: bool = True
 
 settings = Settings()
\ No newline at end of file
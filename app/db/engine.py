@@ -1,27 +1,50 @@
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
 from .config import settings
 
 class Engine(object):
     def __init__(self, database_url) -> None:
+        # __new__ returns the existing instance, but Python still calls __init__ on it; keep its engine and pool
+        if self._initialized:
+            return
         self.database_url = database_url
-        self.db_engine = create_async_engine(self.database_url, echo=True, future=True)
-        self.async_session = sessionmaker(self.db_engine, class_=AsyncSession, expire_on_commit=False)
+        self.db_engine = create_async_engine(self.database_url, echo=settings.sql_echo, future=True, **self._pool_options())
+        self.async_session = async_sessionmaker(self.db_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+        self._initialized = True
 
         
+    def _pool_options(self) -> dict:
+        # SQLite connections are cheap and tied to their file, so they are not pooled
+        if make_url(self.database_url).get_backend_name() == "sqlite":
+            return {"poolclass": NullPool}
+        return {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+        }
+
     async def create_db_and_tables(self):  
         async with self.db_engine.begin() as engine:
+            if engine.dialect.name == "postgresql":
+                # Trigram indexes (used by the search on text columns) need the pg_trgm extension
+                await engine.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
             await engine.run_sync(SQLModel.metadata.create_all)
 
     async def get_session(self) -> AsyncSession:
+        # Opening a session does not check out a pooled connection; that only happens on the first statement,
+        # so requests that never touch the database never wait on the pool.
         async with self.async_session() as session:
             yield session
         
     def __new__(cls, database_url):
         if not hasattr(cls, "instance"):
             cls.instance = super(Engine, cls).__new__(cls)
+            cls.instance._initialized = False
         return cls.instance
 
 
@@ -0,0 +1,26 @@
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class now(FunctionElement):
+    """
+    The current local time, as a SQL expression usable in a `server_default`.
+
+    On SQLite it renders the same text format SQLAlchemy stores Python datetimes in (with microseconds), so
+    values filled by the database and values written by the application compare and sort correctly together.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(now)
+def _compile_now(element: now, compiler, **kwargs) -> str:
+    return "now()"
+
+
+@compiles(now, "sqlite")
+def _compile_now_sqlite(element: now, compiler, **kwargs) -> str:
+    # %f only has milliseconds, so pad it to the six digits of SQLAlchemy's format
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now', 'localtime')"
@@ -2,6 +2,7 @@ import sys
 from contextlib import asynccontextmanager
 
 from config import settings
+from core.responses import ModelJSONResponse
 from db.engine import db_engine
 from exceptions import CustomException
 from fastapi import FastAPI, Request, Response
@@ -13,7 +14,6 @@ from loguru import logger
 from middlewares.v1.log import LogMiddleware
 from routers import api_routers
 from users.services import user_services
-from db.engine import db_engine
 
 
 @asynccontextmanager
@@ -39,6 +39,7 @@ app = FastAPI(
     """,
     version="0.0.1",
     lifespan=lifespan,
+    default_response_class=ModelJSONResponse,
 )
 
 
@@ -1,11 +1,16 @@
-from core.controllers import BaseControllers
+from core.controllers import BaseControllers, register_converter
 from core.dependencies import CommonsDependencies
 
 from . import schemas
 from .services import task_services, TaskServices
 from .models import Tasks
 
+# Tasks rows are already validated, so responses are built without a second validation pass
+register_converter(model=Tasks, schema=schemas.Response)
+
 class TaskControllers(BaseControllers[TaskServices]):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(controller_name="tasks", service=task_services)
 
@@ -13,7 +18,7 @@ class TaskControllers(BaseControllers[TaskServices]):
         return await self.service.create(data=data, commons=commons)
 
     async def edit(self, _id: int, data: schemas.EditRequest, commons: CommonsDependencies) -> Tasks:
-        await self.get_by_id(_id=_id, commons=commons)
+        # The UPDATE itself raises NotFound when the task does not exist or is not owned by the user
         return await self.service.edit(_id=_id, data=data, commons=commons)
 
 
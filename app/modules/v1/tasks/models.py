@@ -1,27 +1,26 @@
 from datetime import datetime
 from typing import Literal, Optional
-from typing_extensions import Self
 
+from db.functions import now
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, String
-from . import schemas
 
 class Tasks(SQLModel, table=True):
+    # Listing tasks filters by status and sorts by creation time; this also serves filters on status alone.
+    # The trigram index lets PostgreSQL serve the `summary ILIKE '%...%'` search without scanning the table.
+    __table_args__ = (
+        Index("ix_tasks_status_created_at", "status", "created_at"),
+        Index("ix_tasks_summary_trgm", "summary", postgresql_using="gin", postgresql_ops={"summary": "gin_trgm_ops"}),
+    )
+
     id: int = Field(primary_key=True)
     summary: str
     description: Optional[str] = Field(default=None)
     status: Literal["to_do", "in_progress", "done"] = Field(sa_type=String)
-    created_at: datetime = Field(default_factory=datetime.now)
-    created_by: Optional[int] = Field(default=None, foreign_key="users.id")
+    # Filled by the database when the INSERT leaves it out, and read back with RETURNING
+    created_at: datetime = Field(default=None, index=True, sa_column_kwargs={"server_default": now()})
+    created_by: Optional[int] = Field(default=None, foreign_key="users.id", index=True)
     updated_at: Optional[datetime] = Field(default=None)
     updated_by: Optional[int] = Field(default=None, foreign_key="users.id")
-    deleted_at: Optional[datetime] = Field(default=None)
+    deleted_at: Optional[datetime] = Field(default=None, index=True)
     deleted_by: Optional[int] = Field(default=None, foreign_key="users.id")
-
-
-    @classmethod
-    def from_create_request(cls, data: schemas.CreateRequest, status: str = "to_do") -> Self:
-        return cls(
-            summary=data.summary,
-            description=data.description,
-            status=status
-        )
\ No newline at end of file
@@ -1,5 +1,6 @@
 from auth.decoractor import access_control
 from core.dependencies import CommonsDependencies
+from core.responses import ModelJSONResponse
 from core.schemas import PaginationParams
 from fastapi import Depends
 from fastapi_restful.cbv import cbv
@@ -30,27 +31,37 @@ class RoutersCBV:
             limit=pagination.limit,
             sort_by=pagination.sort_by,
             order_by=pagination.order_by,
+            cursor=pagination.cursor,
+            skip_count=pagination.skip_count,
             commons=self.commons,
         )
-        return schemas.ListResponse.model_validate(results, from_attributes=True)
+        page = schemas.ListResponse.model_construct(
+            total_items=results.total_items,
+            total_page=results.total_page,
+            records_per_page=results.records_per_page,
+            next_cursor=results.next_cursor,
+            results=[task_controllers.convert_orm_to_schema(schema=schemas.Response, data=result) for result in results.results],
+        )
+        # Returned as a response so the page is serialized straight from the schema, without jsonable_encoder
+        return ModelJSONResponse(content=page)
 
     @router.get("/tasks/{_id}", status_code=200, responses={200: {"model": schemas.Response, "description": "Get task success"}})
     @access_control(public=False)
     async def get_detail(self, _id: int):
         result = await task_controllers.get_by_id(_id=_id, commons=self.commons)
-        return schemas.Response.model_validate(result, from_attributes=True)
+        return task_controllers.convert_orm_to_schema(schema=schemas.Response, data=result)
 
     @router.post("/tasks", status_code=201, responses={201: {"model": schemas.Response, "description": "Register task success"}})
     @access_control(public=False)
     async def create(self, data: schemas.CreateRequest):
         result = await task_controllers.create(data=data, commons=self.commons)
-        return schemas.Response.model_validate(result, from_attributes=True)
+        return task_controllers.convert_orm_to_schema(schema=schemas.Response, data=result)
 
     @router.put("/tasks/{_id}", status_code=200, responses={200: {"model": schemas.Response, "description": "Update task success"}})
     @access_control(public=False)
     async def edit(self, _id: int, data: schemas.EditRequest):
         result = await task_controllers.edit(_id=_id, data=data, commons=self.commons)
-        return schemas.Response.model_validate(result, from_attributes=True)
+        return task_controllers.convert_orm_to_schema(schema=schemas.Response, data=result)
 
     @router.delete("/tasks/{_id}", status_code=204)
     @access_control(public=False)
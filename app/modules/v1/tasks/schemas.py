@@ -22,6 +22,7 @@ class ListResponse(BaseModel):
     total_items: int
     total_page: int
     records_per_page: int
+    next_cursor: Optional[str] = None
     results: List[Response]
 
 
@@ -11,13 +11,15 @@ class TaskServices(BaseServices[Tasks]):
         super().__init__(service_name="tasks", crud=crud, model=Tasks)
 
     async def create(self, data: schemas.CreateRequest, commons: CommonsDependencies) -> Tasks:
-        data = Tasks.from_create_request(data=data, created_by=commons.current_user)
+        data = Tasks(**data.model_dump(exclude_unset=True), status="to_do", created_by=commons.current_user)
         return await self.save(data=data, commons=commons)
 
     async def edit(self, _id: int, data: schemas.EditRequest, commons: CommonsDependencies) -> Tasks:
-        data = internal_models.EditWithAudit(summary=data.summary, description=data.description, status=data.status, updated_by=commons.current_user)
+        # Only the fields sent in the request are set, so the UPDATE leaves the other columns untouched
+        data = internal_models.EditWithAudit(**data.model_dump(exclude_unset=True, exclude_none=True), updated_at=commons.now, updated_by=commons.current_user)
         return await self.update_by_id(_id=_id, data=data, commons=commons)
 
 
-task_crud = BaseCRUD(model=Tasks)
+# Task lists only load the columns of the list response
+task_crud = BaseCRUD(model=Tasks, columns=[Tasks.id, Tasks.summary, Tasks.description, Tasks.status, Tasks.created_at, Tasks.created_by])
 task_services = TaskServices(crud=task_crud)
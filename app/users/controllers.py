@@ -5,6 +5,8 @@ from .services import user_services, UserServices
 from .models import Users
 
 class UserControllers(BaseControllers[UserServices]):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(controller_name="users", service=user_services)
 
@@ -14,13 +16,18 @@ class UserControllers(BaseControllers[UserServices]):
     async def login(self, email: str, password: str, commons: CommonsDependencies) -> Users:
         return await self.service.login(email=email, password=password, commons=commons)
 
+    async def authenticate(self, email: str, commons: CommonsDependencies) -> Users:
+        return await self.service.authenticate(email=email, commons=commons)
+
+    async def verify_password(self, user: Users, password: str) -> None:
+        return await self.service.verify_password(user=user, password=password)
+
     async def get_me(self, commons: CommonsDependencies) -> Users:
         current_user_id = self.get_current_user(commons=commons)
         return await self.get_by_id(_id=current_user_id, commons=commons)
 
     async def edit(self, _id: int, data: schemas.EditRequest, commons: CommonsDependencies) -> Users:
-        # Check if that user id exists or not
-        await self.get_by_id(_id=_id, commons=commons)
+        # The UPDATE itself raises NotFound when the user does not exist
         return await self.service.edit(_id=_id, data=data, commons=commons)
     
     async def edit_me(self, data: schemas.EditRequest, commons: CommonsDependencies) -> Users:
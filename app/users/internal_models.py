@@ -7,10 +7,6 @@ from utils.value import UserRoles
 from . import schemas
 
 
-class UpdateCreatedBy(BaseModel):
-    created_by: int
-
-
 class EditWithAudit(schemas.EditRequest):
     updated_at: datetime = Field(default_factory=datetime.now)
     updated_by: int
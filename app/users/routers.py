@@ -1,5 +1,6 @@
 from auth.decoractor import access_control
 from core.dependencies import CommonsDependencies
+from core.responses import ModelJSONResponse
 from core.schemas import PaginationParams
 from fastapi import Depends
 from fastapi_restful.cbv import cbv
@@ -52,11 +53,19 @@ class RoutersCBV:
             limit=pagination.limit,
             sort_by=pagination.sort_by,
             order_by=pagination.order_by,
+            cursor=pagination.cursor,
+            skip_count=pagination.skip_count,
             commons=self.commons,
         )
-        if pagination.fields:
-            return results
-        return schemas.ListResponse.model_validate(results, from_attributes=True)
+        page = schemas.ListResponse.model_construct(
+            total_items=results.total_items,
+            total_page=results.total_page,
+            records_per_page=results.records_per_page,
+            next_cursor=results.next_cursor,
+            results=schemas.ResponseListAdapter.validate_python(results.results, from_attributes=True),
+        )
+        # Returned as a response so the page is serialized straight from the schema, without jsonable_encoder
+        return ModelJSONResponse(content=page)
 
     @router.get("/users/{_id}", status_code=200, responses={200: {"model": schemas.Response, "description": "Get user success"}})
     @access_control(public=False)
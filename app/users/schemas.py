@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from core.schemas import EmailStr, PhoneStr
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class Response(BaseModel):
@@ -18,12 +18,12 @@ class ListResponse(BaseModel):
     total_items: int
     total_page: int
     records_per_page: int
+    next_cursor: Optional[str] = None
     results: List[Response]
 
 
-class LoginResponse(Response):
-    access_token: str
-    token_type: str
+# Built once at import so list responses reuse the compiled validator instead of going through ListResponse
+ResponseListAdapter = TypeAdapter(List[Response])
 
 
 class EditRequest(BaseModel):
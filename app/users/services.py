@@ -23,46 +23,64 @@ class UserServices(BaseServices[Users]):
         data = Users(fullname=fullname, email=email, password=password)
         if phone_number:
             data.phone_number = phone_number
-        if self.get_current_user(commons=commons):
-            data.created_by = self.get_current_user(commons=commons)
         # Set the user role to 'USER' by default.
         data.type = value.UserRoles.USER.value
         # Add the current datetime as the creation time. 
-        data.created_at = self.get_current_datetime()
+        data.created_at = commons.now
         # Hash the provided password using bcrypt with a generated salt.
         data.password = await auth_services.hash(value=data.password)
         # Save the user, ensuring the email is unique, using the save_unique function.
-        user = await self.save_unique(data=data, unique_field="email", commons=commons)
-        
-        data_update = internal_models.UpdateCreatedBy(created_by=user.id)
-        user = await self.update_by_id(_id=user.id, data=data_update, commons=commons)
-        return user
+        # The user is recorded as its own creator by the same INSERT.
+        return await self.save_unique(data=data, unique_field="email", self_references="created_by", commons=commons)
 
-    async def login(self, email: str, password: str, commons: CommonsDependencies) -> Users:
+    async def authenticate(self, email: str, commons: CommonsDependencies) -> Users:
         user = await self.get_by_email(email=email, commons=commons, ignore_error=True)
         if not user:
             raise UserErrorCode.Unauthorize()
+        return user
+
+    async def verify_password(self, user: Users, password: str) -> None:
         # Validate the provided password against the hashed value.
         is_valid_password = await auth_services.validate_hash(value=password, hashed_value=user.password)
         if not is_valid_password:
             raise UserErrorCode.Unauthorize()
+
+    async def login(self, email: str, password: str, commons: CommonsDependencies) -> Users:
+        user = await self.authenticate(email=email, commons=commons)
+        await self.verify_password(user=user, password=password)
         return user
 
     async def edit(self, _id: int, data: schemas.EditRequest | Users, commons: CommonsDependencies) -> Users:
-        data = internal_models.EditWithAudit(fullname=data.fullname, phone=data.phone_number, updated_by=commons.current_user)
+        # Only the fields sent in the request are set, so the UPDATE leaves the other columns untouched.
+        # The request allows extra fields, so only the declared ones are dumped.
+        values = data.model_dump(include=set(schemas.EditRequest.model_fields), exclude_unset=True, exclude_none=True)
+        data = internal_models.EditWithAudit(**values, updated_at=commons.now, updated_by=commons.current_user)
         return await self.update_by_id(_id=_id, data=data, commons=commons)
 
     async def grant_admin(self, _id: int, commons: CommonsDependencies) -> Users:
-        data = internal_models.GrantAdmin(updated_by=commons.current_user)
-        return await self.update_by_id(_id=_id, data=data, commons=commons)  
+        # The role is set explicitly, as only the set fields are written
+        data = internal_models.GrantAdmin(type=value.UserRoles.ADMIN.value, updated_at=commons.now, updated_by=commons.current_user)
+        return await self.update_by_id(_id=_id, data=data, commons=commons)
 
     async def create_admin(self, session:AsyncSession):
         commons = CommonsDependencies.from_session(session=session)
-        admin = await self.get_by_field(data=settings.default_admin_email, field_name="email", commons=commons, ignore_error=True)
-        if admin:
-            return admin
-        admin = await self.register(fullname="Admin", email=settings.default_admin_email, password=settings.default_admin_password, commons=commons)
-        return await self.grant_admin(_id=admin.id, commons=commons)
+        # An existing user with the admin email is returned unchanged. Its role is never raised here, since anyone can
+        # register that email before the bootstrap runs.
+        admins = await self.get_by_field(
+            data=settings.default_admin_email, field_name="email", commons=commons, ignore_error=True, include_deleted=True
+        )
+        if admins:
+            return admins[0]
+        password = await auth_services.hash(value=settings.default_admin_password)
+        data = Users(
+            fullname="Admin", email=settings.default_admin_email, password=password, type=value.UserRoles.ADMIN.value, created_at=commons.now
+        )
+        admin = await self.save_unique(data=data, unique_field="email", self_references="created_by", commons=commons, ignore_error=True)
+        if not admin:
+            # Another worker created the same user between the lookup and the insert
+            admins = await self.get_by_field(data=settings.default_admin_email, field_name="email", commons=commons, include_deleted=True)
+            admin = admins[0]
+        return admin
 
 
 user_crud = BaseCRUD(model=models.Users)
@@ -1,4 +1,6 @@
 from datetime import datetime
+from typing import Iterable, Tuple
+
 from utils import value
 
 
@@ -27,3 +29,20 @@ def convert_str_to_datetime(datetime_str: str) -> datetime:
 
     """
     return datetime.strptime(datetime_str, value.DataFormat.DATE_TIME.value)
+
+
+def convert_to_tuple(values: str | Iterable[str]) -> Tuple[str, ...]:
+    """
+    Converts a single string or an iterable of strings to a tuple of strings.
+
+    Args:
+        values (str | Iterable[str]): The string or strings to be converted.
+
+    Returns:
+        values_tuple (tuple): A tuple holding the single string, or the strings of the iterable.
+    """
+    if isinstance(values, tuple):
+        return values
+    if isinstance(values, str):
+        return (values,)
+    return tuple(values)
@@ -1,6 +1,9 @@
 import re
 from .value import DataFormat
 
+_EMAIL_RE = re.compile(DataFormat.EMAIL_REGEX.value)
+_PHONE_RE = re.compile(DataFormat.PHONE_REGEX.value)
+
 
 def check_email(email):
     """
@@ -12,10 +15,7 @@ def check_email(email):
     Returns:
         is_valid (bool): True if the email matches the regex pattern, False otherwise.
     """
-    pattern = DataFormat.EMAIL_REGEX.value
-    if re.match(pattern, email):
-        return True
-    return False
+    return _EMAIL_RE.match(email) is not None
 
 
 def check_phone(phone):
@@ -28,7 +28,4 @@ def check_phone(phone):
     Returns:
         is_valid (bool): True if the phone number matches the regex pattern, False otherwise.
     """
-    pattern = DataFormat.PHONE_REGEX.value
-    if re.match(pattern, phone):
-        return True
-    return False
+    return _PHONE_RE.match(phone) is not None
@@ -0,0 +1,52 @@
+import pytest
+from auth.services import auth_services
+from httpx import AsyncClient
+
+payload_user_register = {"fullname": "authuser", "email": "auth@example.com", "password": "testpassword"}
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_register_invalid_json(client: AsyncClient):
+    response = await client.post("v1/auth/register", content=b"{", headers={"Content-Type": "application/json"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_register_extra_field(client: AsyncClient):
+    payload = {**payload_user_register, "type": "admin"}
+    response = await client.post("v1/auth/register", json=payload)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_login_extra_field(client: AsyncClient):
+    response = await client.post("v1/auth/register", json=payload_user_register)
+    assert response.status_code == 201
+    payload = {"email": payload_user_register["email"], "password": payload_user_register["password"], "remember": True}
+    response = await client.post("v1/auth/login", json=payload)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_register_password_too_short(client: AsyncClient):
+    payload = {**payload_user_register, "email": "short@example.com", "password": "short"}
+    response = await client.post("v1/auth/register", json=payload)
+    assert response.status_code == 400
+    assert response.json()["type"] == "users/info/invalid-password-length"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_login_wrong_password_not_cached(client: AsyncClient):
+    payload = {"fullname": "cacheuser", "email": "cache@example.com", "password": "testpassword"}
+    response = await client.post("v1/auth/register", json=payload)
+    assert response.status_code == 201
+    user = response.json()
+    auth_services._token_cache.clear()
+
+    response = await client.post("v1/auth/login", json={"email": payload["email"], "password": "wrongpassword"})
+    assert response.status_code == 401
+    assert (user["id"], user["type"]) not in auth_services._token_cache
+
+    response = await client.post("v1/auth/login", json={"email": payload["email"], "password": payload["password"]})
+    assert response.status_code == 201
+    assert auth_services._token_cache[(user["id"], user["type"])][1] == response.json()["access_token"]
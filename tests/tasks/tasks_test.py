@@ -0,0 +1,78 @@
+import pytest
+from httpx import AsyncClient
+
+payload_user_register = {"fullname": "taskuser", "email": "tasks@example.com", "password": "testpassword"}
+payload_tasks = [
+    {"summary": "task 1", "description": "b"},
+    {"summary": "task 2"},
+    {"summary": "task 3", "description": "a"},
+    {"summary": "task 4"},
+    {"summary": "task 5", "description": "c"},
+]
+
+
+async def get_headers(client: AsyncClient) -> dict:
+    response = await client.post("v1/auth/login", json={"email": payload_user_register["email"], "password": payload_user_register["password"]})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def get_all_pages(client: AsyncClient, headers: dict, params: dict) -> list:
+    tasks, cursor = [], None
+    # Bounded, so a cursor that does not move forward fails the test instead of looping forever
+    for _ in range(len(payload_tasks) + 1):
+        response = await client.get("v1/tasks", headers=headers, params={**params, "cursor": cursor} if cursor else params)
+        assert response.status_code == 200
+        response = response.json()
+        tasks.extend(response["results"])
+        cursor = response["next_cursor"]
+        if not cursor:
+            return tasks
+    pytest.fail("The cursor did not reach the last page")
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_task_create(client: AsyncClient):
+    await client.post("v1/auth/register", json=payload_user_register)
+    headers = await get_headers(client)
+    for payload in payload_tasks:
+        response = await client.post("v1/tasks", headers=headers, json=payload)
+        assert response.status_code == 201
+        assert response.json()["summary"] == payload["summary"]
+        assert response.json()["created_at"]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_task_cursor_pages(client: AsyncClient):
+    headers = await get_headers(client)
+    response = await client.get("v1/tasks", headers=headers, params={"limit": 100})
+    all_ids = [task["id"] for task in response.json()["results"]]
+    assert len(all_ids) == len(payload_tasks)
+    assert [task["id"] for task in await get_all_pages(client, headers, {"limit": 2})] == all_ids
+
+
+@pytest.mark.asyncio(scope="session")
+@pytest.mark.parametrize("order_by, descriptions", [("asc", ["a", "b", "c", None, None]), ("desc", ["c", "b", "a", None, None])])
+async def test_task_cursor_pages_nullable_sort(client: AsyncClient, order_by: str, descriptions: list):
+    headers = await get_headers(client)
+    tasks = await get_all_pages(client, headers, {"limit": 2, "sort_by": "description", "order_by": order_by})
+    assert [task["description"] for task in tasks] == descriptions
+    assert len({task["id"] for task in tasks}) == len(payload_tasks)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_task_cursor_other_sort_options(client: AsyncClient):
+    headers = await get_headers(client)
+    response = await client.get("v1/tasks", headers=headers, params={"limit": 2})
+    cursor = response.json()["next_cursor"]
+    for params in ({"sort_by": "id"}, {"order_by": "asc"}):
+        response = await client.get("v1/tasks", headers=headers, params={"limit": 2, "cursor": cursor, **params})
+        assert response.status_code == 400
+        assert response.json()["type"] == "core/info/invalid-cursor"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_task_invalid_cursor(client: AsyncClient):
+    headers = await get_headers(client)
+    response = await client.get("v1/tasks", headers=headers, params={"cursor": "invalid"})
+    assert response.status_code == 400
+    assert response.json()["type"] == "core/info/invalid-cursor"
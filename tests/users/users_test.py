@@ -1,5 +1,12 @@
 import pytest
+from core.dependencies import CommonsDependencies
+from db.engine import db_engine
+from exceptions import CustomException
 from httpx import AsyncClient
+from sqlmodel import update
+from users.config import settings as user_settings
+from users.models import Users
+from users.services import user_services
 
 payload_user_register = {"fullname": "testuser", "email": "test@example.com", "password": "testpassword"}
 
@@ -10,6 +17,18 @@ async def test_user_register_success(client: AsyncClient):
     assert response.status_code == 201
 
 
+@pytest.mark.asyncio(scope="session")
+async def test_user_register_created_by(client: AsyncClient):
+    payload = {"fullname": "createdby", "email": "createdby@example.com", "password": "testpassword"}
+    response = await client.post("v1/auth/register", json=payload)
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+    # A registered user is recorded as its own creator
+    async with db_engine.async_session() as session:
+        user = await session.get(Users, user_id)
+    assert user.created_by == user_id
+
+
 @pytest.mark.asyncio(scope="session")
 async def test_user_login(client: AsyncClient):
     payload = {"email": "test@example.com", "password": "testpassword"}
@@ -45,3 +64,106 @@ async def test_user_edit(client: AsyncClient):
     response = await client.put("v1/users/me", headers=headers, json=payload)
     assert response.status_code == 200
     assert response.json()["fullname"] == "new_name"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_user_partial_edit(client: AsyncClient):
+    user = await test_user_login(client)
+    headers = {"Authorization": f"Bearer {user['access_token']}"}
+    response = await client.put("v1/users/me", headers=headers, json={"fullname": "partial_name", "phone_number": "0123456789"})
+    assert response.status_code == 200
+
+    # Fields that are not sent keep their stored values
+    response = await client.put("v1/users/me", headers=headers, json={"fullname": "other_name"})
+    assert response.status_code == 200
+    assert response.json()["phone_number"] == "0123456789"
+    response = await client.put("v1/users/me", headers=headers, json={"phone_number": "0987654321"})
+    assert response.status_code == 200
+    assert response.json()["fullname"] == "other_name"
+    assert response.json()["phone_number"] == "0987654321"
+
+    # Extra fields are not written
+    response = await client.put("v1/users/me", headers=headers, json={"fullname": "extra_name", "type": "admin"})
+    assert response.status_code == 200
+    assert response.json()["type"] == "user"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_user_edit_not_modified(client: AsyncClient):
+    user = await test_user_login(client)
+    headers = {"Authorization": f"Bearer {user['access_token']}"}
+    response = await client.put("v1/users/me", headers=headers, json={"fullname": "same_name"})
+    assert response.status_code == 200
+    response = await client.put("v1/users/me", headers=headers, json={"fullname": "same_name"})
+    assert response.status_code == 304
+
+
+async def login_admin(client: AsyncClient) -> dict:
+    payload = {"email": user_settings.default_admin_email, "password": user_settings.default_admin_password}
+    response = await client.post("v1/auth/login", json=payload)
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_user_list_skip_count(client: AsyncClient):
+    admin = await login_admin(client)
+    headers = {"Authorization": f"Bearer {admin['access_token']}"}
+    response = await client.get("v1/users", headers=headers, params={"limit": 1})
+    assert response.status_code == 200
+    total_items = response.json()["total_items"]
+    assert total_items > 1
+
+    response = await client.get("v1/users", headers=headers, params={"limit": 1, "skip_count": True})
+    assert response.status_code == 200
+    response = response.json()
+    assert response["total_items"] == -1
+    assert response["total_page"] == -1
+    assert len(response["results"]) == 1
+    assert response["next_cursor"]
+
+    # The totals stay skipped on the following pages
+    response = await client.get("v1/users", headers=headers, params={"limit": 1, "skip_count": True, "cursor": response["next_cursor"]})
+    assert response.status_code == 200
+    assert response.json()["total_items"] == -1
+    assert len(response.json()["results"]) == 1
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_create_admin_keeps_existing_user(client: AsyncClient):
+    admin = await login_admin(client)
+    assert admin["type"] == "admin"
+
+    # A regular user already holding the admin email, e.g. registered before the bootstrap, is not promoted
+    async with db_engine.async_session() as session:
+        await session.exec(update(Users).where(Users.id == admin["id"]).values(type="user"))
+        await session.commit()
+    try:
+        async with db_engine.async_session() as session:
+            result = await user_services.create_admin(session=session)
+        assert result.id == admin["id"]
+        assert result.type == "user"
+        async with db_engine.async_session() as session:
+            user = await session.get(Users, admin["id"])
+        assert user.type == "user"
+    finally:
+        async with db_engine.async_session() as session:
+            await session.exec(update(Users).where(Users.id == admin["id"]).values(type="admin"))
+            await session.commit()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_grant_admin(client: AsyncClient):
+    payload = {"fullname": "grantadmin", "email": "grantadmin@example.com", "password": "testpassword"}
+    response = await client.post("v1/auth/register", json=payload)
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+
+    async with db_engine.async_session() as session:
+        commons = CommonsDependencies.from_session(session=session)
+        user = await user_services.grant_admin(_id=user_id, commons=commons)
+        assert user.type == "admin"
+        # Granting again changes no written field, so it is reported as not modified
+        with pytest.raises(CustomException) as error:
+            await user_services.grant_admin(_id=user_id, commons=CommonsDependencies.from_session(session=session))
+        assert error.value.status == 304